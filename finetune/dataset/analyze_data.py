@@ -19,9 +19,10 @@ import sys
 from pathlib import Path
 from collections import Counter, defaultdict
 from dataclasses import dataclass
+from typing import Iterable
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from dataset.schema import TrainingExample, OutputType, load_examples
+from dataset.schema import TrainingExample, OutputType, iter_examples
 
 
 @dataclass
@@ -81,7 +82,10 @@ def extract_named_entities(query: str) -> list:
     return entities
 
 
-def analyze_examples(examples: list[TrainingExample]) -> tuple[DatasetStats, dict, dict]:
+def analyze_examples(
+    examples: Iterable[TrainingExample], max_samples: int | None = None
+) -> tuple[DatasetStats, dict, dict]:
+    """Collect stats in one pass, keeping up to max_samples queries per category."""
     stats = DatasetStats()
     categories: Counter = Counter()
     seen_queries: set[str] = set()
@@ -106,7 +110,9 @@ def analyze_examples(examples: list[TrainingExample]) -> tuple[DatasetStats, dic
 
         category = categorize_query(ex.query)
         categories[category] += 1
-        category_examples[category].append(ex.query)
+        samples = category_examples[category]
+        if max_samples is None or len(samples) < max_samples:
+            samples.append(ex.query)
 
         if extract_named_entities(ex.query):
             stats.named_entity_queries += 1
@@ -221,8 +227,9 @@ def main():
     print(f"Analyzing: {input_path}")
     print()
 
-    examples = load_examples(input_path)
-    stats, categories, category_examples = analyze_examples(examples)
+    stats, categories, category_examples = analyze_examples(
+        iter_examples(input_path), max_samples=args.show_examples
+    )
     print_report(stats, categories, category_examples)
 
     if args.show_examples > 0:
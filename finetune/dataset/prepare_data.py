@@ -33,6 +33,8 @@ from transformers import AutoTokenizer
 _tokenizer = None
 _tokenizer_model = None
 
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def get_tokenizer():
     global _tokenizer, _tokenizer_model
@@ -128,11 +130,14 @@ def main():
     # Deduplicate by query (case-insensitive)
     seen: set[str] = set()
     deduped: list[TrainingExample] = []
+    short_final = 0
     for ex in all_examples:
         key = ex.query.lower().strip()
         if key not in seen:
             seen.add(key)
             deduped.append(ex)
+            if len(ex.query.split()) <= 2:
+                short_final += 1
     if len(deduped) < len(all_examples):
         print(f"Deduplicated: {len(all_examples)} -> {len(deduped)}")
     all_examples = deduped
@@ -149,18 +154,18 @@ def main():
     train_data = formatted[:split_idx]
     val_data = formatted[split_idx:]
 
-    # Write (these are ephemeral build artifacts)
+    # Write (these are ephemeral build artifacts). A 1 MiB buffer and a
+    # single writelines() per file keep syscalls and per-line calls down.
     for name, data in [("train.jsonl", train_data), ("val.jsonl", val_data)]:
-        with open(output_dir / name, "w") as f:
-            for item in data:
-                f.write(json.dumps(item) + "\n")
+        with open(output_dir / name, "w", buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(json.dumps(item) + "\n" for item in data)
 
-    with open(output_dir / "train_chat.jsonl", "w") as f:
-        for item in train_data:
-            f.write(json.dumps({"messages": item["messages"]}) + "\n")
+    with open(output_dir / "train_chat.jsonl", "w", buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(
+            json.dumps({"messages": item["messages"]}) + "\n" for item in train_data
+        )
 
     # Stats
-    short_final = sum(1 for ex in all_examples if len(ex.query.split()) <= 2)
     print(f"\n=== Summary ===")
     print(f"Total examples: {len(all_examples)}")
     print(f"Short queries: {short_final} ({100 * short_final / len(all_examples):.1f}%)")
@@ -15,15 +15,15 @@ There is exactly ONE format. No alternatives, no legacy fallbacks.
 
 from __future__ import annotations
 
-import json
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Iterable
+from typing import Annotated, Iterable, Iterator
 
 from pydantic import (
     BaseModel,
     BeforeValidator,
     ConfigDict,
+    ValidationError,
     field_validator,
 )
 
@@ -62,6 +62,8 @@ class OutputPair(BaseModel):
 
 def _coerce_output_pairs(v: list) -> list[OutputPair]:
     """Accept [["lex", "..."], ...] from JSON and coerce to OutputPair list."""
+    if not isinstance(v, (list, tuple)):
+        raise ValueError(f"output must be a list of [type, text] pairs, got {v!r}")
     pairs = []
     for i, item in enumerate(v):
         if isinstance(item, OutputPair):
@@ -115,24 +117,38 @@ class TrainingExample(BaseModel):
 # Loading
 # ---------------------------------------------------------------------------
 
-def load_examples(path: str | Path) -> list[TrainingExample]:
-    """Load and validate a JSONL file. Fails loudly on any bad line."""
+def json_error_message(e: ValidationError) -> str | None:
+    """One-line parse error if a model_validate_json() failure was malformed
+    JSON rather than a schema violation, else None."""
+    for err in e.errors():
+        if err["type"] == "json_invalid":
+            return err["msg"].removeprefix("Invalid JSON: ")
+    return None
+
+
+def iter_examples(path: str | Path) -> Iterator[TrainingExample]:
+    """Stream and validate a JSONL file line by line. Fails loudly on any bad line."""
     path = Path(path)
-    examples: list[TrainingExample] = []
     with path.open("r", encoding="utf-8") as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
             if not line:
                 continue
+            # Parse and validate in one step with pydantic-core's native
+            # JSON parser instead of json.loads() + model_validate().
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"{path}:{line_num}: invalid JSON: {e}") from e
-            try:
-                examples.append(TrainingExample.model_validate(obj))
-            except Exception as e:
+                example = TrainingExample.model_validate_json(line)
+            except ValidationError as e:
+                json_error = json_error_message(e)
+                if json_error is not None:
+                    raise ValueError(f"{path}:{line_num}: invalid JSON: {json_error}") from e
                 raise ValueError(f"{path}:{line_num}: {e}") from e
-    return examples
+            yield example
+
+
+def load_examples(path: str | Path) -> list[TrainingExample]:
+    """Load and validate a JSONL file. Fails loudly on any bad line."""
+    return list(iter_examples(path))
 
 
 # ---------------------------------------------------------------------------
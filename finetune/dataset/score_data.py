@@ -10,26 +10,36 @@ from __future__ import annotations
 import argparse
 import statistics
 import sys
+from contextlib import nullcontext
+from multiprocessing import Pool
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from dataset.schema import load_examples, output_items_to_text
+from dataset.schema import iter_examples, output_items_to_text
 from reward import score_expansion_detailed
 
 
-def score_file(path: Path) -> tuple[int, int, list[float], dict]:
+def score_file(path: Path) -> tuple[int, int, list[float], dict, str | None]:
+    """Return (total, errors, scores, ratings, load_error).
+
+    load_error is reported by the caller rather than printed here, so output
+    stays ordered when files are scored in worker processes.
+    """
     total = 0
     errors = 0
     scores: list[float] = []
     ratings: dict[str, int] = {}
 
-    try:
-        examples = load_examples(path)
-    except ValueError as e:
-        print(f"  Error loading {path}: {e}")
-        return 0, 1, [], {}
+    # Only loading/validation errors abort the file; scoring errors propagate.
+    examples = iter_examples(path)
+    while True:
+        try:
+            ex = next(examples)
+        except StopIteration:
+            break
+        except ValueError as e:
+            return 0, 1, [], {}, f"Error loading {path}: {e}"
 
-    for ex in examples:
         total += 1
         output_text = output_items_to_text(ex.output)
         if not output_text:
@@ -42,7 +52,37 @@ def score_file(path: Path) -> tuple[int, int, list[float], dict]:
         rating = detail["rating"]
         ratings[rating] = ratings.get(rating, 0) + 1
 
-    return total, errors, scores, ratings
+    return total, errors, scores, ratings, None
+
+
+def report_file(
+    path: Path,
+    total: int,
+    errors: int,
+    scores: list[float],
+    ratings: dict,
+    load_error: str | None,
+) -> None:
+    if load_error:
+        print(f"  {load_error}")
+    if scores:
+        avg = statistics.mean(scores)
+        median = statistics.median(scores)
+        min_score = min(scores)
+        max_score = max(scores)
+        above_70 = sum(1 for s in scores if s >= 70.0)
+        pct_70 = above_70 / len(scores) * 100
+        print(
+            f"{path}: {len(scores)} scored, {errors} errors, "
+            f"avg {avg:.1f}, median {median:.1f}, min {min_score:.1f}, "
+            f"max {max_score:.1f}, >=70 {pct_70:.1f}%"
+        )
+    else:
+        print(f"{path}: 0 scored, {errors} errors")
+
+    if ratings:
+        rating_parts = [f"{k}:{v}" for k, v in sorted(ratings.items())]
+        print(f"  ratings: {', '.join(rating_parts)}")
 
 
 def main() -> int:
@@ -53,6 +93,12 @@ def main() -> int:
         default=["finetune/data/*.jsonl"],
         help="JSONL files or glob patterns (default: finetune/data/*.jsonl)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Score files in parallel across N processes (default: 1)",
+    )
     args = parser.parse_args()
 
     repo_root = Path(__file__).parent.parent.parent
@@ -68,26 +114,14 @@ def main() -> int:
         print("No files found to score.")
         return 1
 
-    for path in sorted(files):
-        total, errors, scores, ratings = score_file(path)
-        if scores:
-            avg = statistics.mean(scores)
-            median = statistics.median(scores)
-            min_score = min(scores)
-            max_score = max(scores)
-            above_70 = sum(1 for s in scores if s >= 70.0)
-            pct_70 = above_70 / len(scores) * 100
-            print(
-                f"{path}: {len(scores)} scored, {errors} errors, "
-                f"avg {avg:.1f}, median {median:.1f}, min {min_score:.1f}, "
-                f"max {max_score:.1f}, >=70 {pct_70:.1f}%"
-            )
-        else:
-            print(f"{path}: 0 scored, {errors} errors")
-
-        if ratings:
-            rating_parts = [f"{k}:{v}" for k, v in sorted(ratings.items())]
-            print(f"  ratings: {', '.join(rating_parts)}")
+    # Scoring is pure-Python CPU work, so fan files out across processes.
+    # imap() yields in submission order, keeping the report deterministic.
+    paths = sorted(files)
+    workers = min(args.workers, len(paths))
+    with Pool(workers) if workers > 1 else nullcontext() as pool:
+        results = pool.imap(score_file, paths) if pool else map(score_file, paths)
+        for path, result in zip(paths, results):
+            report_file(path, *result)
 
     return 0
 
@@ -8,12 +8,13 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
+from pydantic import ValidationError
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from dataset.schema import TrainingExample
+from dataset.schema import TrainingExample, json_error_message
 
 
 def validate_file(path: Path) -> tuple[int, int]:
@@ -27,16 +28,13 @@ def validate_file(path: Path) -> tuple[int, int]:
                 continue
             total += 1
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError as e:
-                print(f"{path}:{line_num}: invalid JSON ({e})")
-                errors += 1
-                continue
-
-            try:
-                TrainingExample.model_validate(obj)
-            except Exception as e:
-                print(f"{path}:{line_num}: {e}")
+                TrainingExample.model_validate_json(line)
+            except ValidationError as e:
+                json_error = json_error_message(e)
+                if json_error is not None:
+                    print(f"{path}:{line_num}: invalid JSON ({json_error})")
+                else:
+                    print(f"{path}:{line_num}: {e}")
                 errors += 1
 
     return total, errors
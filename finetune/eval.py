@@ -19,13 +19,12 @@ By default, query file defaults to evals/queries.txt and runs all queries unless
 
 import argparse
 import json
-import re
 import sys
 from pathlib import Path
 
 # Import reward scoring
 sys.path.insert(0, str(Path(__file__).parent))
-from reward import score_expansion_detailed
+from reward import THINK_BLOCK_PATTERN, score_expansion_detailed
 
 
 
@@ -109,7 +108,7 @@ def generate_batch(
     for i in range(len(queries)):
         gen_tokens = out[i][input_len:]
         text = tokenizer.decode(gen_tokens, skip_special_tokens=True)
-        text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
+        text = THINK_BLOCK_PATTERN.sub("", text)
         outputs.append(text.strip())
 
     return outputs
@@ -7,6 +7,8 @@ import argparse
 import importlib
 import json
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -50,9 +52,12 @@ def load_topics(path: Path) -> list[str]:
     return topics
 
 
-def write_jsonl_line(handle, query: str, output_text: str) -> None:
+def write_jsonl_line(handle, query: str, output_text: str) -> str:
+    """Write one example and return the serialized line (without newline)."""
     output = parse_output_text(output_text)
-    handle.write(json.dumps({"query": query, "output": output}, ensure_ascii=False) + "\n")
+    line = json.dumps({"query": query, "output": output}, ensure_ascii=False)
+    handle.write(line + "\n")
+    return line
 
 
 def parse_queries(text: str) -> list[str]:
@@ -72,6 +77,13 @@ def main() -> int:
     parser.add_argument("--output", type=str, required=True, help="Output JSONL path")
     parser.add_argument("--model", type=str, required=True, help="LM string in provider/model format")
     parser.add_argument("--per-topic", type=int, default=3, help="Queries to generate per topic")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent LM requests per stage (query generation, expansion)")
+    parser.add_argument(
+        "--num-retries",
+        type=int,
+        default=8,
+        help="Retries (exponential backoff) on rate-limit and transient API errors",
+    )
     args = parser.parse_args()
 
     prompt_text = Path(args.prompt).read_text(encoding="utf-8").strip()
@@ -100,26 +112,66 @@ def main() -> int:
         def forward(self, topic: str, count: int):
             return self.predict(topic=topic, count=str(count))
 
-    lm = dspy.LM(model=args.model)
+    lm = dspy.LM(model=args.model, num_retries=args.num_retries)
     gen = Generator()
     gen.set_lm(lm)
     qgen = QueryGenerator()
     qgen.set_lm(lm)
 
+    def generate_queries(topic: str) -> list[str]:
+        qpred = qgen(topic=topic, count=args.per_topic)
+        qtext = getattr(qpred, "queries", "") or ""
+        generated = parse_queries(qtext)
+        if not generated:
+            generated = [topic]
+        return generated[: args.per_topic]
+
+    def expand(query: str) -> str:
+        pred = gen(query=query)
+        return getattr(pred, "expansion", "") or ""
+
+    # Related topics often yield the same query; prepare_data.py dedups by
+    # lowercased query anyway, so only expand the first occurrence in topic
+    # order. Only called from the main thread, which walks topics in order.
+    seen_queries: set[str] = set()
+
+    def claim_query(query: str) -> bool:
+        key = query.lower().strip()
+        if key in seen_queries:
+            return False
+        seen_queries.add(key)
+        return True
+
     topics = load_topics(Path(args.topics))
-    with Path(args.output).open("w", encoding="utf-8") as f_out:
-        for topic in topics:
-            qpred = qgen(topic=topic, count=args.per_topic)
-            qtext = getattr(qpred, "queries", "") or ""
-            generated = parse_queries(qtext)
-            if not generated:
-                generated = [topic]
-            generated = generated[: args.per_topic]
-            for query in generated:
-                pred = gen(query=query)
-                output_text = getattr(pred, "expansion", "") or ""
-                write_jsonl_line(f_out, query, output_text)
-                print(json.dumps({"query": query, "output": parse_output_text(output_text)}, ensure_ascii=False))
+    workers = max(1, args.workers)
+    # LM calls are network-bound; keep several in flight. Query generation
+    # and expansion use separate pools so expansions for early topics start
+    # while later topics are still generating queries. The main thread
+    # submits expansions and writes results in topic order, flushing each
+    # finished prefix as it goes.
+    query_pool = ThreadPoolExecutor(max_workers=workers)
+    expand_pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        topic_futures = [query_pool.submit(generate_queries, topic) for topic in topics]
+        pending: deque[tuple[str, Future[str]]] = deque()
+        with Path(args.output).open("w", encoding="utf-8") as f_out:
+
+            def write_ready(block: bool) -> None:
+                while pending and (block or pending[0][1].done()):
+                    query, expansion_future = pending.popleft()
+                    print(write_jsonl_line(f_out, query, expansion_future.result()))
+
+            for topic_future in topic_futures:
+                for query in topic_future.result():
+                    if claim_query(query):
+                        pending.append((query, expand_pool.submit(expand, query)))
+                write_ready(block=False)
+            write_ready(block=True)
+    finally:
+        # On failure, drop queued LM calls instead of paying for all of them
+        # before the error surfaces. A completed run has nothing queued.
+        for pool in (query_pool, expand_pool):
+            pool.shutdown(cancel_futures=True)
 
     print(f"Wrote {args.output}")
     return 0
@@ -30,6 +30,10 @@ from collections import Counter
 # Format: "query /only:lex" (slash prefix, no space after colon)
 ONLY_MODE_PATTERN = re.compile(r'\s+/only:(lex|vec|hyde)\s*$', re.IGNORECASE)
 
+# Compiled once at import; these run on every scored completion.
+THINK_BLOCK_PATTERN = re.compile(r'<think>.*?</think>', re.DOTALL)
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
 STOPWORDS = frozenset({
     'the', 'a', 'an', 'is', 'are', 'to', 'for', 'of', 'in',
     'and', 'or', 'it', 'this', 'that', 'be', 'with', 'as', 'on', 'by',
@@ -72,6 +76,13 @@ GENERIC_LEX_PHRASES = frozenset({
     'what is', 'how to', 'guide to', 'help with',
 })
 
+# (phrase, words, first word) split once at import for lex_is_generic().
+_GENERIC_LEX_PHRASE_PARTS = tuple(
+    (phrase, tuple(phrase.split()), phrase.split()[0])
+    for phrase in GENERIC_LEX_PHRASES
+)
+_GENERIC_LEX_FIRST_WORDS = tuple({first for _, _, first in _GENERIC_LEX_PHRASE_PARTS})
+
 # Chat template tokens that indicate a broken output
 CHAT_TEMPLATE_TOKENS = frozenset({
     '<|im_start|>', '<|im_end|>', '<|endoftext|>',
@@ -124,7 +135,7 @@ def clean_model_output(text: str) -> tuple[str, bool]:
 
     used_thinking = '<think>' in text and '</think>' in text
     if used_thinking:
-        text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL).strip()
+        text = THINK_BLOCK_PATTERN.sub('', text).strip()
 
     return text, used_thinking
 
@@ -211,10 +222,15 @@ def lex_preserves_entities(line: str, entities: set) -> bool:
 def lex_is_generic(lex_line: str) -> bool:
     """Is this lex line a useless generic filler phrase?"""
     lower = lex_line.lower().strip()
-    for phrase in GENERIC_LEX_PHRASES:
-        if phrase in lower or lower.startswith(phrase.split()[0]):
+    # Fast path: most lex lines neither start like nor contain any phrase.
+    if not lower.startswith(_GENERIC_LEX_FIRST_WORDS) and not any(
+        phrase in lower for phrase in GENERIC_LEX_PHRASES
+    ):
+        return False
+    for phrase, words, first in _GENERIC_LEX_PHRASE_PARTS:
+        if phrase in lower or lower.startswith(first):
             remaining = lower
-            for word in phrase.split():
+            for word in words:
                 remaining = remaining.replace(word, '', 1).strip()
             if len(remaining) < 3:
                 return True
@@ -242,7 +258,7 @@ def echoes_query(expansion: str, query: str) -> bool:
 
 def word_repetition_penalty(text: str) -> int:
     """Penalty for words repeated 3+ times (excluding stopwords)."""
-    counts = Counter(re.findall(r'\b\w+\b', text.lower()))
+    counts = Counter(WORD_PATTERN.findall(text.lower()))
     return sum((c - 2) * 2 for w, c in counts.items()
                if c >= 3 and w not in STOPWORDS and len(w) > 2)
 